@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import atexit
+import datetime
 import logging
 import os
+import random
 import sys
+import queue
 import time
 from logging.handlers import RotatingFileHandler
-from multiprocessing import Process
+from multiprocessing import get_context
 
 import schedule
 
@@ -27,6 +31,11 @@ log_formatter = logging.Formatter(u'%(asctime)s - %(levelname)-10s - %(name)-20s
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)
 
+# Skip collecting thread/process details for each record, the log format does not use them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Set schedule logger to ERROR
 logging.getLogger('schedule').setLevel(logging.ERROR)
 logging.getLogger("requests").setLevel(logging.WARNING)
@@ -73,11 +82,24 @@ lock.ensure_lock_folder()
 # Init thread class
 thread = Thread()
 
+# Process pool for non-local syncers (created in run mode once the syncers are loaded)
+task_pool = None
+
+# Uploaders whose scheduled disk check is still in progress, and the sizes measured for them in the background
+checking_uploaders = set()
+measured_uploaders = queue.Queue()
+
+# When the last scheduled upload finished, sizes measured before then are measured again before uploading
+last_upload_finished = 0
+
 # Logic vars
 uploader_delay = cache.get_cache('uploader_bans')
 syncer_delay = cache.get_cache('syncer_bans')
 sa_delay = cache.get_cache('sa_bans')
 
+# Settings a mover config must have before a move is attempted
+REQUIRED_MOVER_KEYS = frozenset({'move_from_remote', 'move_to_remote', 'rclone_extras'})
+
 
 ############################################################
 # MISC FUNCS
@@ -103,34 +125,36 @@ def init_service_accounts():
             # If service_account path provided, loop over the service account files and provide
             # one at a time when starting the uploader. If upload completes successfully, do not attempt
             # to use the other accounts
-            accounts = {os.path.join(os.path.normpath(uploader_config['service_account_path']),
-                                     sa_file): None for sa_file in
-                        os.listdir(os.path.normpath(uploader_config['service_account_path'])) if
-                        sa_file.endswith(".json")}
+            service_account_path = os.path.normpath(uploader_config['service_account_path'])
+            with os.scandir(service_account_path) as entries:
+                accounts = {entry.path: None for entry in entries if
+                            entry.name.endswith(".json") and entry.is_file()}
             current_accounts = sa_delay[uploader_remote]
             if current_accounts is not None:
                 # Service account files may have moved, invalidate any missing cached accounts.
                 cached_accounts = list(current_accounts)
                 for cached_account in cached_accounts:
-                    log.debug(f"Checking for cached service account file '{cached_account}' for remote '{uploader_remote}'")
-                    if not cached_account.startswith(os.path.normpath(uploader_config['service_account_path'])):
-                        log.debug(f"Cached service account file '{cached_account}' for remote '{uploader_remote}' is not located in specified service_account_path ('{uploader_config['service_account_path']}'). Removing from available accounts.")
+                    log.debug("Checking for cached service account file '%s' for remote '%s'", cached_account, uploader_remote)
+                    if not cached_account.startswith(service_account_path):
+                        log.debug("Cached service account file '%s' for remote '%s' is not located in specified service_account_path ('%s'). Removing from available accounts.",
+                                  cached_account, uploader_remote, uploader_config['service_account_path'])
                         current_accounts.pop(cached_account)
-                    if not os.path.exists(cached_account):
-                        log.debug(f"Cached service account file '{cached_account}' for remote '{uploader_remote}' could not be located. Removing from available accounts.")
+                    elif cached_account not in accounts:
+                        log.debug("Cached service account file '%s' for remote '%s' could not be located. Removing from available accounts.",
+                                  cached_account, uploader_remote)
                         current_accounts.pop(cached_account)
 
                 # Add any new account files.
                 for account in accounts:
                     if account not in current_accounts:
-                        log.debug(f"New service account '{account}' has been added for remote '{uploader_remote}'")
+                        log.debug("New service account '%s' has been added for remote '%s'", account, uploader_remote)
                         current_accounts[account] = None
                 sa_delay[uploader_remote] = current_accounts
                 if len(current_accounts) < len(accounts):
-                    log.debug(f"Additional service accounts were added. Lifting any current bans for remote '{uploader_remote}'")
+                    log.debug("Additional service accounts were added. Lifting any current bans for remote '%s'", uploader_remote)
                     uploader_delay.pop(uploader_remote, None)
             else:
-                log.debug(f"The following accounts are defined: '{accounts}' and are about to be added to remote '{uploader_remote}'")
+                log.debug("The following accounts are defined: '%s' and are about to be added to remote '%s'", accounts, uploader_remote)
                 sa_delay[uploader_remote] = accounts
     log.debug("Finished initializing of service accounts.")
 
@@ -138,12 +162,9 @@ def init_service_accounts():
 def init_syncers():
     try:
         for syncer_name, syncer_config in conf.configs['syncer'].items():
-            # remove irrelevant parameters before loading syncer agent
-            filtered_config = syncer_config.copy()
-            filtered_config.pop('sync_interval', None)
-            filtered_config['syncer_name'] = syncer_name
-            # load syncer agent
-            syncer.load(**filtered_config)
+            # load syncer agent, leaving out parameters that are only used for scheduling
+            syncer.load(syncer_name=syncer_name,
+                        **{key: value for key, value in syncer_config.items() if key != 'sync_interval'})
     except Exception:
         log.exception("Exception initializing syncer agents: ")
 
@@ -151,17 +172,23 @@ def init_syncers():
 def check_suspended_sa(uploader_to_check):
     global sa_delay
     try:
-        if sa_delay[uploader_to_check] is not None:
-            log.debug(f"Proceeding to check any timeouts which have passed for remote {uploader_to_check}")
-            for account, suspension_expiry in sa_delay[uploader_to_check].items():
+        now = time.time()
+        current_data = sa_delay[uploader_to_check]
+        if current_data is not None:
+            log.debug("Proceeding to check any timeouts which have passed for remote %s", uploader_to_check)
+            changed = False
+            for account, suspension_expiry in current_data.items():
                 if suspension_expiry is not None:
-                    log.debug(f"Service account {suspension_expiry} was previously banned. Checking if timeout has passed")
+                    log.debug("Service account %s was previously banned. Checking if timeout has passed", account)
                     # Remove any ban times for service accounts which have passed
-                    if time.time() > suspension_expiry:
-                        log.debug(f"Setting ban status for service_account {account} to None since timeout has passed")
-                        current_data = sa_delay[uploader_to_check]
+                    if now > suspension_expiry:
+                        log.debug("Setting ban status for service_account %s to None since timeout has passed", account)
                         current_data[account] = None
-                        sa_delay[uploader_to_check] = current_data
+                        changed = True
+            # write the updated bans back to the cache once, rather than once per expired account
+            if changed:
+                sa_delay[uploader_to_check] = current_data
+        return current_data
     except Exception:
         log.exception("Exception checking suspended service accounts: ")
 
@@ -171,8 +198,9 @@ def check_suspended_uploaders(uploader_to_check=None):
 
     suspended = False
     try:
-        for uploader_name, suspension_expiry in dict(uploader_delay.items()).items():
-            if time.time() < suspension_expiry:
+        now = time.time()
+        for uploader_name, suspension_expiry in list(uploader_delay.items()):
+            if now < suspension_expiry:
                 # this remote is still delayed due to a previous abort due to triggers
                 use_logger = (
                     log.debug
@@ -180,12 +208,14 @@ def check_suspended_uploaders(uploader_to_check=None):
                     else log.info
                 )
 
-                use_logger(f"{uploader_name} is still suspended due to a previously aborted upload. Normal operation in {misc.seconds_to_string(int(suspension_expiry - time.time()))} at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(suspension_expiry))}")
+                use_logger("%s is still suspended due to a previously aborted upload. Normal operation in %s at %s",
+                           uploader_name, misc.seconds_to_string(int(suspension_expiry - now)),
+                           time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(suspension_expiry)))
                 # return True when suspended if uploader_to_check is supplied and this is that remote
                 if uploader_to_check and uploader_name == uploader_to_check:
                     suspended = True
             else:
-                log.warning(f"{uploader_name} is no longer suspended due to a previous aborted upload!")
+                log.warning("%s is no longer suspended due to a previous aborted upload!", uploader_name)
                 uploader_delay.pop(uploader_name, None)
                 # send notification that remote is no longer timed out
                 notify.send(message=f"Upload suspension has expired for remote: {uploader_name}")
@@ -200,8 +230,9 @@ def check_suspended_syncers(syncer_to_check=None):
 
     suspended = False
     try:
-        for syncer_name, suspension_expiry in dict(syncer_delay.items()).items():
-            if time.time() < suspension_expiry:
+        now = time.time()
+        for syncer_name, suspension_expiry in list(syncer_delay.items()):
+            if now < suspension_expiry:
                 # this syncer is still delayed due to a previous abort due to triggers
                 use_logger = (
                     log.debug
@@ -209,12 +240,14 @@ def check_suspended_syncers(syncer_to_check=None):
                     else log.info
                 )
 
-                use_logger(f"{syncer_name} is still suspended due to a previously aborted sync. Normal operation in {misc.seconds_to_string(int(suspension_expiry - time.time()))} at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(suspension_expiry))}")
+                use_logger("%s is still suspended due to a previously aborted sync. Normal operation in %s at %s",
+                           syncer_name, misc.seconds_to_string(int(suspension_expiry - now)),
+                           time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(suspension_expiry)))
                 # return True when suspended if syncer_to_check is supplied and this is that remote
                 if syncer_to_check and syncer_name == syncer_to_check:
                     suspended = True
             else:
-                log.warning(f"{syncer_name} is no longer suspended due to a previous aborted sync!")
+                log.warning("%s is no longer suspended due to a previous aborted sync!", syncer_name)
                 syncer_delay.pop(syncer_name, None)
                 # send notification that remote is no longer timed out
                 notify.send(message=f"Sync suspension has expired for syncer: {syncer_name}")
@@ -224,10 +257,60 @@ def check_suspended_syncers(syncer_to_check=None):
     return suspended
 
 
-def run_process(task, manager_dict, **kwargs):
+def report_upload_result(uploader_remote, upload_success):
+    if upload_success:
+        log.info("Upload completed successfully for uploader: %s", uploader_remote)
+        # send successful upload notification
+        notify.send(message=f"Upload was completed successfully for remote: {uploader_remote}")
+    else:
+        log.info("Upload not completed successfully for uploader: %s", uploader_remote)
+        # send unsuccessful upload notification
+        notify.send(message=f"Upload was not completed successfully for remote: {uploader_remote}")
+
+
+def add_schedule_jitter(job, interval_seconds):
+    # offset the first run by up to a minute so jobs sharing an interval do not all fire together
+    job.next_run += datetime.timedelta(seconds=random.uniform(0, min(60, interval_seconds)))
+    return job
+
+
+def close_task_pool():
+    # terminate rather than close, a worker killed by Ctrl+C loses its task and joining a closed pool
+    # would then wait for it forever
+    if task_pool is not None:
+        task_pool.terminate()
+        task_pool.join()
+
+
+def init_process():
+    # sqlitedict serves each cache from a background thread, which does not survive the fork into a
+    # pool worker, so the worker opens its own connections
+    global cache, uploader_delay, syncer_delay, sa_delay
+    cache = Cache(conf.settings['cachefile'])
+    uploader_delay = cache.get_cache('uploader_bans')
+    syncer_delay = cache.get_cache('syncer_bans')
+    sa_delay = cache.get_cache('sa_bans')
+
+
+def init_task_pool():
+    global task_pool
+    if not any(syncer_conf['service'].lower() != 'local' for syncer_conf in conf.configs['syncer'].values()):
+        return
+
+    # forked explicitly (forkserver/spawn workers would re-import this script, re-parsing argv and reloading
+    # the config) and before any uploader thread is started. every sync holds the sync lock for its whole
+    # run, so a single worker is all that can ever be busy
+    task_pool = get_context('fork').Pool(processes=1, initializer=init_process)
+    atexit.register(close_task_pool)
+
+
+def run_process(task, **kwargs):
+    def log_task_error(error):
+        # pool results are never waited on, so surface failures from the worker here
+        log.exception("Exception in process with kwargs=%r: ", kwargs, exc_info=error)
+
     try:
-        new_process = Process(target=task, args=(manager_dict,), kwargs=kwargs)
-        return new_process.start()
+        return task_pool.apply_async(task, kwds=kwargs, error_callback=log_task_error)
     except Exception:
         log.exception("Exception starting process with kwargs=%r: ", kwargs)
 
@@ -238,7 +321,7 @@ def run_process(task, manager_dict, **kwargs):
 
 
 @decorators.timed
-def do_upload(remote=None):
+def do_upload(remote=None, upload_size=None):
     global uploader_delay
     global sa_delay
 
@@ -258,8 +341,11 @@ def do_upload(remote=None):
                 # retrieve rclone config for this remote
                 rclone_config = conf.configs['remotes'][uploader_remote]
 
-                # send notification that upload is starting
-                notify.send(message=f"Upload of {path.get_size(rclone_config['upload_folder'], uploader_config['size_excludes'])} GB has begun for remote: {uploader_remote}")
+                # send notification that upload is starting (skip the du walk when nothing would be notified)
+                if notify.enabled:
+                    if not remote or upload_size is None:
+                        upload_size = path.get_size(rclone_config['upload_folder'], uploader_config['size_excludes'])
+                    notify.send(message=f"Upload of {upload_size} GB has begun for remote: {uploader_remote}")
 
                 uploader = Uploader(uploader_remote,
                                     uploader_config,
@@ -268,98 +354,88 @@ def do_upload(remote=None):
                                     conf.configs['core']['rclone_config_path'],
                                     conf.configs['core']['dry_run'])
 
-                if sa_delay[uploader_remote] is not None:
-                    available_accounts = [account for account, last_ban_time in sa_delay[uploader_remote].items() if
+                current_data = sa_delay[uploader_remote]
+                if current_data is not None:
+                    available_accounts = [account for account, last_ban_time in current_data.items() if
                                           last_ban_time is None]
                     available_accounts_size = len(available_accounts)
 
                     if available_accounts_size:
                         available_accounts = misc.sorted_list_by_digit_asc(available_accounts)
 
-                    log.info(f"There is {available_accounts_size} available service accounts")
-                    log.debug(f"Available service accounts: {str(available_accounts)}")
+                    log.info("There is %d available service accounts", available_accounts_size)
+                    log.debug("Available service accounts: %s", available_accounts)
 
                     # If there are no service accounts available, do not even bother attempting the upload
                     if not available_accounts_size:
-                        log.info(f"Upload aborted due to the fact that no service accounts are currently unbanned and available to use for remote {uploader_remote}")
+                        log.info("Upload aborted due to the fact that no service accounts are currently unbanned and available to use for remote %s", uploader_remote)
                         # add remote to uploader_delay
-                        time_till_unban = misc.get_lowest_remaining_time(sa_delay[uploader_remote])
-                        log.info(f"Lowest Remaining time till unban is {time_till_unban}")
+                        time_till_unban = misc.get_lowest_remaining_time(current_data)
+                        log.info("Lowest Remaining time till unban is %s", time_till_unban)
                         uploader_delay[uploader_remote] = time_till_unban
                     else:
                         for i in range(available_accounts_size):
                             uploader.set_service_account(available_accounts[i])
                             resp_delay, resp_trigger, resp_success = uploader.upload()
                             if resp_delay:
-                                current_data = sa_delay[uploader_remote]
-                                current_data[available_accounts[i]] = time.time() + ((60 * 60) * resp_delay)
+                                # keep working on the map loaded above and persist it once per ban
+                                current_data[available_accounts[i]] = time.time() + 3600 * resp_delay
                                 sa_delay[uploader_remote] = current_data
-                                log.debug(f"Setting account {available_accounts[i]} as unbanned at {sa_delay[uploader_remote][available_accounts[i]]}")
+                                log.debug("Setting account %s as unbanned at %s", available_accounts[i], current_data[available_accounts[i]])
                                 if i != (len(available_accounts) - 1):
-                                    log.info(f"Upload aborted due to trigger: {resp_trigger} being met, {uploader_remote} is cycling to service_account file: {available_accounts[i + 1]}")
+                                    log.info("Upload aborted due to trigger: %s being met, %s is cycling to service_account file: %s",
+                                             resp_trigger, uploader_remote, available_accounts[i + 1])
                                     # Set unban time for current service account
-                                    log.debug(f"Setting service account {available_accounts[i]} as banned for remote: {uploader_remote}")
+                                    log.debug("Setting service account %s as banned for remote: %s", available_accounts[i], uploader_remote)
                                     continue
                                 else:
                                     # non 0 result indicates a trigger was met, the result is how many hours
                                     # to sleep this remote for
                                     # Before banning remote, check that a service account did not become unbanned
                                     # during upload
-                                    check_suspended_sa(sa_delay[uploader_remote])
+                                    current_data = check_suspended_sa(uploader_remote) or current_data
 
-                                    unban_time = misc.get_lowest_remaining_time(sa_delay[uploader_remote])
+                                    unban_time = misc.get_lowest_remaining_time(current_data)
                                     if unban_time is not None:
-                                        log.info(f"Upload aborted due to trigger: {resp_trigger} being met, {uploader_remote} will continue automatic uploading normally in {resp_delay} hours")
+                                        log.info("Upload aborted due to trigger: %s being met, %s will continue automatic uploading normally in %s hours",
+                                                 resp_trigger, uploader_remote, resp_delay)
 
                                         # add remote to uploader_delay
-                                        log.debug(f"Adding unban time for {uploader_remote} as {misc.get_lowest_remaining_time(sa_delay[uploader_remote])}")
-                                        uploader_delay[uploader_remote] = misc.get_lowest_remaining_time(
-                                            sa_delay[uploader_remote])
+                                        log.debug("Adding unban time for %s as %s", uploader_remote, unban_time)
+                                        uploader_delay[uploader_remote] = unban_time
 
                                         # send aborted upload notification
                                         notify.send(message=f"Upload was aborted for remote: {uploader_remote} due to trigger {resp_trigger}. Uploads suspended for {resp_delay} hours")
                             else:
-                                if resp_success:
-                                    log.info(f"Upload completed successfully for uploader: {uploader_remote}")
-                                    # send successful upload notification
-                                    notify.send(message=f"Upload was completed successfully for remote: {uploader_remote}")
-                                else:
-                                    log.info(f"Upload not completed successfully for uploader: {uploader_remote}")
-                                    # send unsuccessful upload notification
-                                    notify.send(message=f"Upload was not completed successfully for remote: {uploader_remote}")
+                                report_upload_result(uploader_remote, resp_success)
 
                                 # Remove ban for service account
-                                sa_delay[uploader_remote][available_accounts[i]] = None
+                                current_data[available_accounts[i]] = None
+                                sa_delay[uploader_remote] = current_data
                                 break
                 else:
                     resp_delay, resp_trigger, resp_success = uploader.upload()
                     if resp_delay:
                         if uploader_remote not in uploader_delay:
                             # this uploader was not already in the delay dict, so lets put it there
-                            log.info(f"Upload aborted due to trigger: {resp_trigger} being met, {uploader_remote} will continue automatic uploading normally in {resp_delay} hours")
+                            log.info("Upload aborted due to trigger: %s being met, %s will continue automatic uploading normally in %s hours",
+                                     resp_trigger, uploader_remote, resp_delay)
                             # add remote to uploader_delay
-                            uploader_delay[uploader_remote] = time.time() + 60 ** 2 * resp_delay
+                            uploader_delay[uploader_remote] = time.time() + 3600 * resp_delay
                             # send aborted upload notification
                             notify.send(message=f"Upload was aborted for remote: {uploader_remote} due to trigger {resp_trigger}. Uploads suspended for {resp_delay} hours")
                         else:
                             # this uploader is already in the delay dict, lets not delay it any further
-                            log.info(f"Upload aborted due to trigger: {resp_trigger} being met for {uploader_remote} uploader")
+                            log.info("Upload aborted due to trigger: %s being met for %s uploader", resp_trigger, uploader_remote)
                             # send aborted upload notification
                             notify.send(message=f"Upload was aborted for remote: {uploader_remote} due to trigger {resp_trigger}.")
                     else:
-                        if resp_success:
-                            log.info(f"Upload completed successfully for uploader: {uploader_remote}")
-                            # send successful upload notification
-                            notify.send(message=f"Upload was completed successfully for remote: {uploader_remote}")
-                        else:
-                            log.info(f"Upload not completed successfully for uploader: {uploader_remote}")
-                            # send unsuccessful upload notification
-                            notify.send(message=f"Upload was not completed successfully for remote: {uploader_remote}")
+                        report_upload_result(uploader_remote, resp_success)
 
                         # remove uploader from uploader_delays (as its no longer banned)
-                        if uploader_remote in uploader_delay and uploader_delay.pop(uploader_remote, None) is not None:
+                        if uploader_delay.pop(uploader_remote, None) is not None:
                             # this uploader was in the delay dict, but upload was successful, lets remove it
-                            log.info(f"{uploader_remote} is no longer suspended due to a previous aborted upload!")
+                            log.info("%s is no longer suspended due to a previous aborted upload!", uploader_remote)
 
                 # remove leftover empty directories from disk
                 if not conf.configs['core']['dry_run']:
@@ -372,32 +448,32 @@ def do_upload(remote=None):
                         continue
 
                     # validate we have the bare minimum config settings set
-                    required_configs = ['move_from_remote', 'move_to_remote', 'rclone_extras']
-                    required_set = True
-                    for setting in required_configs:
-                        if setting not in uploader_config['mover']:
-                            log.error(f"Unable to act on '{uploader_remote}' mover because there was no '{setting}' setting in the mover configuration")
-                            required_set = False
-                            break
+                    missing_settings = REQUIRED_MOVER_KEYS - uploader_config['mover'].keys()
+                    for setting in sorted(missing_settings):
+                        log.error("Unable to act on '%s' mover because there was no '%s' setting in the mover configuration",
+                                  uploader_remote, setting)
 
                     # do move if good
-                    if required_set:
+                    if not missing_settings:
                         mover = RcloneMover(uploader_config['mover'],
                                             conf.configs['core']['rclone_binary_path'],
                                             conf.configs['core']['rclone_config_path'],
                                             conf.configs['core']['dry_run'])
-                        log.info(f"Move starting from {uploader_config['mover']['move_from_remote']} -> {uploader_config['mover']['move_to_remote']}")
+                        log.info("Move starting from %s -> %s", uploader_config['mover']['move_from_remote'],
+                                 uploader_config['mover']['move_to_remote'])
 
                         # send notification that mover has started
                         notify.send(message=f"Move has started for {uploader_config['mover']['move_from_remote']} -> {uploader_config['mover']['move_to_remote']}")
 
                         if mover.move():
-                            log.info(f"Move completed successfully from {uploader_config['mover']['move_from_remote']} -> {uploader_config['mover']['move_to_remote']}")
+                            log.info("Move completed successfully from %s -> %s", uploader_config['mover']['move_from_remote'],
+                                     uploader_config['mover']['move_to_remote'])
                             # send notification move has finished
                             notify.send(message=f"Move finished successfully for {uploader_config['mover']['move_from_remote']} -> {uploader_config['mover']['move_to_remote']}")
 
                         else:
-                            log.error(f"Move failed from {uploader_config['mover']['move_from_remote']} -> {uploader_config['mover']['move_to_remote']} ....?")
+                            log.error("Move failed from %s -> %s ....?", uploader_config['mover']['move_from_remote'],
+                                      uploader_config['mover']['move_to_remote'])
                             # send notification move has failed
                             notify.send(message=f"Move failed for {uploader_config['mover']['move_from_remote']} -> {uploader_config['mover']['move_to_remote']}")
 
@@ -418,29 +494,34 @@ def do_sync(use_syncer=None):
 
     with lock_file:
         log.info("Starting sync")
+        rclone_config_path = conf.configs['core']['rclone_config_path']
+        dry_run = conf.configs['core']['dry_run']
         try:
             for sync_name, sync_config in conf.configs['syncer'].items():
                 # if syncer is not None, skip this syncer if not == syncer
                 if use_syncer and sync_name != use_syncer:
                     continue
 
+                is_local = sync_config['service'].lower() == 'local'
+                instance_destroy = sync_config.get('instance_destroy', True)
+
                 # send notification that sync is starting
-                if sync_config['service'].lower() != 'local':
-                    notify.send(message=f"Sync initiated for syncer: {sync_name}. {'Creating' if sync_config['instance_destroy'] else 'Starting'} {sync_config['service']} instance...")
+                if not is_local:
+                    notify.send(message=f"Sync initiated for syncer: {sync_name}. {'Creating' if instance_destroy else 'Starting'} {sync_config['service']} instance...")
 
                 # startup instance
                 resp, instance_id = syncer.startup(service=sync_config['service'], name=sync_name)
                 if not resp:
                     # send notification of failure to startup instance
-                    notify.send(message=f'Syncer: {sync_name} failed to startup a {"new" if sync_config["instance_destroy"] else "existing"} instance. Manually check no instances are still running!')
+                    notify.send(message=f'Syncer: {sync_name} failed to startup a {"new" if instance_destroy else "existing"} instance. Manually check no instances are still running!')
                     continue
 
                 # setup instance
                 resp = syncer.setup(service=sync_config['service'], instance_id=instance_id,
-                                    rclone_config=conf.configs['core']['rclone_config_path'])
+                                    rclone_config=rclone_config_path)
                 if not resp:
                     # send notification of failure to set up instance
-                    notify.send(message=f'Syncer: {sync_name} failed to setup a {"new" if sync_config["instance_destroy"] else "existing"} instance. Manually check no instances are still running!')
+                    notify.send(message=f'Syncer: {sync_name} failed to setup a {"new" if instance_destroy else "existing"} instance. Manually check no instances are still running!')
                     continue
 
                 # send notification of sync start
@@ -448,8 +529,7 @@ def do_sync(use_syncer=None):
 
                 # do sync
                 resp, resp_delay, resp_trigger = syncer.sync(service=sync_config['service'], instance_id=instance_id,
-                                                             dry_run=conf.configs['core']['dry_run'],
-                                                             rclone_config=conf.configs['core']['rclone_config_path'])
+                                                             dry_run=dry_run, rclone_config=rclone_config_path)
 
                 if not resp and not resp_delay:
                     log.error("Sync unexpectedly failed for syncer: %s", sync_name)
@@ -460,33 +540,34 @@ def do_sync(use_syncer=None):
                     # non 0 resp_delay result indicates a trigger was met, the result is how many hours to sleep
                     if sync_name not in syncer_delay:
                         # this syncer was not in the syncer delay dict, so lets put it there
-                        log.info(f"Sync aborted due to trigger: {resp_trigger} being met, {sync_name} will continue automatic syncing normally in {resp_delay} hours")
+                        log.info("Sync aborted due to trigger: %s being met, %s will continue automatic syncing normally in %s hours",
+                                 resp_trigger, sync_name, resp_delay)
                         # add syncer to syncer_delay
-                        syncer_delay[sync_name] = time.time() + 60 ** 2 * resp_delay
+                        syncer_delay[sync_name] = time.time() + 3600 * resp_delay
                         # send aborted sync notification
                         notify.send(message=f"Sync was aborted for syncer: {sync_name} due to trigger {resp_trigger}. Syncs suspended for {resp_delay} hours")
                     else:
                         # this syncer was already in the syncer delay dict, so lets not delay it any further
-                        log.info(f"Sync aborted due to trigger: {resp_trigger} being met for {sync_name} syncer")
+                        log.info("Sync aborted due to trigger: %s being met for %s syncer", resp_trigger, sync_name)
                         # send aborted sync notification
                         notify.send(message=f"Sync was aborted for syncer: {sync_name} due to trigger {resp_trigger}.")
                 else:
-                    log.info(f"Syncing completed successfully for syncer: {sync_name}")
+                    log.info("Syncing completed successfully for syncer: %s", sync_name)
                     # send successful sync notification
                     notify.send(message=f"Sync was completed successfully for syncer: {sync_name}")
                     # remove syncer from syncer_delay(as its no longer banned)
-                    if sync_name in syncer_delay and syncer_delay.pop(sync_name, None) is not None:
+                    if syncer_delay.pop(sync_name, None) is not None:
                         # this syncer was in the delay dict, but sync was successful, lets remove it
-                        log.info(f"{sync_name} is no longer suspended due to a previous aborted sync!")
+                        log.info("%s is no longer suspended due to a previous aborted sync!", sync_name)
 
                 # destroy instance
                 resp = syncer.destroy(service=sync_config['service'], instance_id=instance_id)
-                if not resp and sync_config['service'].lower() != 'local':
+                if not resp and not is_local:
                     # send notification of failure to destroy/stop instance
-                    notify.send(message=f"Syncer: {sync_name} failed to {'destroy' if sync_config['instance_destroy'] else 'stop'} its instance: {instance_id}. Manually check no instances are still running!")
-                elif sync_config['service'].lower() != 'local':
+                    notify.send(message=f"Syncer: {sync_name} failed to {'destroy' if instance_destroy else 'stop'} its instance: {instance_id}. Manually check no instances are still running!")
+                elif not is_local:
                     notify.send(
-                        message=f"Syncer: {sync_name} has {'destroyed' if sync_config['instance_destroy'] else 'stopped'} its {sync_config['service']} instance")
+                        message=f"Syncer: {sync_name} has {'destroyed' if instance_destroy else 'stopped'} its {sync_config['service']} instance")
 
         except Exception:
             log.exception("Exception occurred while syncing: ")
@@ -502,27 +583,30 @@ def do_hidden():
 
     with lock_file:
         log.info("Starting hidden cleaning")
+        dry_run = conf.configs['core']['dry_run']
+        rclone_binary_path = conf.configs['core']['rclone_binary_path']
+        rclone_config_path = conf.configs['core']['rclone_config_path']
         try:
             # loop each supplied hidden folder
             for hidden_folder, hidden_config in conf.configs['hidden'].items():
-                hidden = UnionfsHiddenFolder(hidden_folder, conf.configs['core']['dry_run'],
-                                             conf.configs['core']['rclone_binary_path'],
-                                             conf.configs['core']['rclone_config_path'])
+                hidden = UnionfsHiddenFolder(hidden_folder, dry_run, rclone_binary_path, rclone_config_path)
 
-                # loop the chosen remotes for this hidden config cleaning files
-                for hidden_remote_name in hidden_config['hidden_remotes']:
-                    # retrieve rclone config for this remote
-                    hidden_remote_config = conf.configs['remotes'][hidden_remote_name]
+                # loop the chosen remotes for this hidden config cleaning files (one notification for all remotes)
+                with notify.batch():
+                    for hidden_remote_name in hidden_config['hidden_remotes']:
+                        # retrieve rclone config for this remote
+                        hidden_remote_config = conf.configs['remotes'][hidden_remote_name]
 
-                    # clean remote
-                    clean_resp, deleted_ok, deleted_fail = hidden.clean_remote(hidden_remote_name, hidden_remote_config)
+                        # clean remote
+                        clean_resp, deleted_ok, deleted_fail = hidden.clean_remote(hidden_remote_name,
+                                                                                   hidden_remote_config)
 
-                    # send notification
-                    if deleted_ok or deleted_fail:
-                        notify.send(message=f"Cleaned {deleted_ok} hidden(s) with {deleted_fail} failure(s) from remote: {hidden_remote_name}")
+                        # send notification
+                        if deleted_ok or deleted_fail:
+                            notify.send(message=f"Cleaned {deleted_ok} hidden(s) with {deleted_fail} failure(s) from remote: {hidden_remote_name}")
 
                 # remove the HIDDEN~ files from disk and empty directories from unionfs-fuse folder
-                if not conf.configs['core']['dry_run']:
+                if not dry_run:
                     hidden.remove_local_hidden()
                     hidden.remove_empty_dirs()
 
@@ -537,23 +621,66 @@ def do_hidden():
 ############################################################
 
 def scheduled_uploader(uploader_name, uploader_settings):
-    log.debug(f"Scheduled disk check triggered for uploader: {uploader_name}")
-    try:
-        rclone_settings = conf.configs['remotes'][uploader_name]
+    log.debug("Scheduled disk check triggered for uploader: %s", uploader_name)
+    if uploader_name in checking_uploaders:
+        log.info("Skipping scheduled disk check for uploader: %s as the previous one is still running", uploader_name)
+        return
 
+    try:
         # check suspended uploaders
         if check_suspended_uploaders(uploader_name):
             return
 
+        # measure used disk space in the background so the disk walks of several uploaders overlap, the result
+        # is picked up by upload_measured_uploader on the main thread
+        checking_uploaders.add(uploader_name)
+        thread.start(measure_uploader, name=uploader_name, args=[uploader_name, uploader_settings])
+
+    except Exception:
+        checking_uploaders.discard(uploader_name)
+        log.exception(f"Unexpected exception occurred while processing uploader {uploader_name}: ")
+
+
+def measure_uploader(uploader_name, uploader_settings):
+    used_space = None
+    measured_at = time.time()
+    try:
+        used_space = path.get_size(conf.configs['remotes'][uploader_name]['upload_folder'],
+                                   uploader_settings['size_excludes'])
+    except Exception:
+        log.exception(f"Unexpected exception occurred while checking disk space for uploader {uploader_name}: ")
+    finally:
+        measured_uploaders.put((uploader_name, uploader_settings, used_space, measured_at))
+
+
+def upload_measured_uploader(timeout):
+    global last_upload_finished
+
+    try:
+        uploader_name, uploader_settings, used_space, measured_at = measured_uploaders.get(timeout=timeout)
+    except queue.Empty:
+        return
+
+    try:
+        if used_space is None:
+            return
+
+        # the measurement may have waited behind another upload, so check again now that nothing else is running
+        if check_suspended_uploaders(uploader_name):
+            return
+
         # clear any banned service accounts
         check_suspended_sa(uploader_name)
 
-        # check used disk space
-        used_space = path.get_size(rclone_settings['upload_folder'], uploader_settings['size_excludes'])
+        # an upload finished since this folder was measured, measure it again
+        if measured_at < last_upload_finished:
+            used_space = path.get_size(conf.configs['remotes'][uploader_name]['upload_folder'],
+                                       uploader_settings['size_excludes'])
 
         # if disk space is above the limit, clean hidden files then upload
         if used_space >= uploader_settings['max_size_gb']:
-            log.info(f"Uploader: {uploader_name}. Local folder size is currently {used_space - uploader_settings['max_size_gb']} GB over the maximum limit of {uploader_settings['max_size_gb']} GB")
+            log.info("Uploader: %s. Local folder size is currently %s GB over the maximum limit of %s GB", uploader_name,
+                     used_space - uploader_settings['max_size_gb'], uploader_settings['max_size_gb'])
 
             # does this uploader have schedule settings
             if 'schedule' in uploader_settings and uploader_settings['schedule']['enabled']:
@@ -561,23 +688,31 @@ def scheduled_uploader(uploader_name, uploader_settings):
                 current_time = time.strftime('%H:%M')
                 if not misc.is_time_between((uploader_settings['schedule']['allowed_from'],
                                              uploader_settings['schedule']['allowed_until'])):
-                    log.info(f"Uploader: {uploader_name}. The current time {current_time} is not within the allowed upload time periods {uploader_settings['schedule']['allowed_from']} -> {uploader_settings['schedule']['allowed_until']}")
+                    log.info("Uploader: %s. The current time %s is not within the allowed upload time periods %s -> %s",
+                             uploader_name, current_time, uploader_settings['schedule']['allowed_from'],
+                             uploader_settings['schedule']['allowed_until'])
                     return
 
-            # clean hidden files
-            do_hidden()
-            # upload
-            do_upload(uploader_name)
+            try:
+                # clean hidden files
+                do_hidden()
+                # upload (reuse the size we just measured for the start notification)
+                do_upload(uploader_name, used_space)
+            finally:
+                last_upload_finished = time.time()
 
         else:
-            log.info(f"Uploader: {uploader_name}. Local folder size is currently {used_space} GB. Still have {uploader_settings['max_size_gb'] - used_space} GB remaining before its eligible to begin uploading...")
+            log.info("Uploader: %s. Local folder size is currently %s GB. Still have %s GB remaining before its eligible to begin uploading...",
+                     uploader_name, used_space, uploader_settings['max_size_gb'] - used_space)
 
     except Exception:
         log.exception(f"Unexpected exception occurred while processing uploader {uploader_name}: ")
+    finally:
+        checking_uploaders.discard(uploader_name)
 
 
 def scheduled_syncer(syncer_name):
-    log.info(f"Scheduled sync triggered for syncer: {syncer_name}")
+    log.info("Scheduled sync triggered for syncer: %s", syncer_name)
     try:
         # check suspended syncers
         if check_suspended_syncers(syncer_name):
@@ -632,18 +767,25 @@ if __name__ == "__main__":
 
             # add uploaders to schedule
             for uploader, uploader_conf in conf.configs['uploader'].items():
-                schedule.every(uploader_conf['check_interval']).minutes.do(scheduled_uploader, uploader, uploader_conf)
-                log.info(f"Added {uploader} uploader to schedule, checking available disk space every {uploader_conf['check_interval']} minutes")
+                add_schedule_jitter(
+                    schedule.every(uploader_conf['check_interval']).minutes.do(scheduled_uploader, uploader,
+                                                                               uploader_conf),
+                    uploader_conf['check_interval'] * 60)
+                log.info("Added %s uploader to schedule, checking available disk space every %s minutes", uploader,
+                         uploader_conf['check_interval'])
 
             # add syncers to schedule
             init_syncers()
+            init_task_pool()
             for syncer_name, syncer_conf in conf.configs['syncer'].items():
                 if syncer_conf['service'].lower() == 'local':
-                    schedule.every(syncer_conf['sync_interval']).hours.do(scheduled_syncer, syncer_name=syncer_name)
+                    job = schedule.every(syncer_conf['sync_interval']).hours.do(scheduled_syncer,
+                                                                                syncer_name=syncer_name)
                 else:
-                    schedule.every(syncer_conf['sync_interval']).hours.do(run_process, scheduled_syncer,
-                                                                          syncer_name=syncer_name)
-                log.info(f"Added {syncer_name} syncer to schedule, syncing every {syncer_conf['sync_interval']} hours")
+                    job = schedule.every(syncer_conf['sync_interval']).hours.do(run_process, scheduled_syncer,
+                                                                                syncer_name=syncer_name)
+                add_schedule_jitter(job, syncer_conf['sync_interval'] * 3600)
+                log.info("Added %s syncer to schedule, syncing every %s hours", syncer_name, syncer_conf['sync_interval'])
 
             # run schedule
             while True:
@@ -651,7 +793,10 @@ if __name__ == "__main__":
                     schedule.run_pending()
                 except Exception:
                     log.exception("Unhandled exception occurred while processing scheduled tasks: ")
-                time.sleep(1)
+                # wait until the next job is due instead of polling every second, uploading for any disk checks
+                # that finish in the meantime
+                idle_seconds = schedule.idle_seconds()
+                upload_measured_uploader(60 if idle_seconds is None else max(0, min(idle_seconds, 60)))
         elif conf.args['cmd'] == 'update_config':
             exit(0)
         else:
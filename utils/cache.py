@@ -3,19 +3,32 @@ import logging
 
 from sqlitedict import SqliteDict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger('cache')
 
 
+def encode(obj):
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
+def decode(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 class Cache:
     def __init__(self, cache_file_path):
         self.cache_file_path = cache_file_path
         self.caches = {
-            'uploader_bans': SqliteDict(self.cache_file_path, tablename='uploader_bans', encode=json.dumps,
-                                        decode=json.loads, autocommit=True),
-            'syncer_bans': SqliteDict(self.cache_file_path, tablename='syncer_bans', encode=json.dumps,
-                                      decode=json.loads, autocommit=True),
-            'sa_bans': SqliteDict(self.cache_file_path, tablename='sa_bans', encode=json.dumps,
-                                  decode=json.loads, autocommit=True)
+            'uploader_bans': SqliteDict(self.cache_file_path, tablename='uploader_bans', encode=encode,
+                                        decode=decode, autocommit=True),
+            'syncer_bans': SqliteDict(self.cache_file_path, tablename='syncer_bans', encode=encode,
+                                      decode=decode, autocommit=True),
+            'sa_bans': SqliteDict(self.cache_file_path, tablename='sa_bans', encode=encode,
+                                  decode=decode, autocommit=True)
         }
 
     def get_cache(self, cache_name):
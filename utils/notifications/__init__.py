@@ -1,4 +1,6 @@
 import logging
+import threading
+from contextlib import contextmanager
 
 from .apprise import Apprise
 from .pushover import Pushover
@@ -16,6 +18,12 @@ SERVICES = {
 class Notifications:
     def __init__(self):
         self.services = []
+        # batches are per thread so concurrent uploaders do not collect each other's messages
+        self.batch_state = threading.local()
+
+    @property
+    def enabled(self):
+        return bool(self.services)
 
     def load(self, **kwargs):
         if 'service' not in kwargs:
@@ -36,7 +44,29 @@ class Notifications:
         except Exception:
             log.exception("Exception while loading service, kwargs=%r: ", kwargs)
 
+    @contextmanager
+    def batch(self):
+        # buffer messages sent inside the block and send them as one joined notification on exit
+        if getattr(self.batch_state, 'messages', None) is not None:
+            yield
+            return
+
+        self.batch_state.messages = []
+        try:
+            yield
+        finally:
+            messages, self.batch_state.messages = self.batch_state.messages, None
+            if messages:
+                self.send(message='\n'.join(messages))
+
     def send(self, **kwargs):
+        # queue plain messages while batching, service specific ones are still sent immediately
+        batched_messages = getattr(self.batch_state, 'messages', None)
+        if batched_messages is not None and kwargs.keys() == {'message'}:
+            if self.services:
+                batched_messages.append(kwargs['message'])
+            return
+
         try:
             # remove service keyword if supplied
             if 'service' in kwargs:
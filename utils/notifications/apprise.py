@@ -1,5 +1,3 @@
-import apprise
-
 import logging
 
 log = logging.getLogger('apprise')
@@ -20,6 +18,9 @@ class Apprise:
 
         # send notification
         try:
+            # apprise loads all of its plugins on import, so only pay for that once a notification is sent
+            import apprise
+
             apobj = apprise.Apprise()
             apobj.add(self.url)
             apobj.notify(
@@ -64,30 +64,17 @@ def opened_files(path):
 
 
 def delete(path):
-    if isinstance(path, list):
-        for item in path:
-            if os.path.exists(item):
-                log.debug("Removing %r", item)
-                try:
-                    if not os.path.isdir(item):
-                        os.remove(item)
-                    else:
-                        os.rmdir(item)
-                except Exception:
-                    log.exception("Exception deleting '%s': ", item)
-            else:
-                log.debug("Skipping deletion of '%s' as it does not exist", item)
-    elif os.path.exists(path):
-        log.debug("Removing %r", path)
+    for item in path if isinstance(path, list) else [path]:
+        log.debug("Removing %r", item)
         try:
-            if not os.path.isdir(path):
-                os.remove(path)
-            else:
-                os.rmdir(path)
+            try:
+                os.remove(item)
+            except IsADirectoryError:
+                os.rmdir(item)
+        except FileNotFoundError:
+            log.debug("Skipping deletion of '%s' as it does not exist", item)
         except Exception:
-            log.exception("Exception deleting '%s': ", path)
-    else:
-        log.debug("Skipping deletion of '%s' as it does not exist", path)
+            log.exception("Exception deleting '%s': ", item)
 
 
 def remove_empty_dirs(path, depth):
@@ -1,4 +1,5 @@
 import glob
+import json
 import logging
 import os
 import time
@@ -7,7 +8,6 @@ import re
 import requests
 import urllib3
 import subprocess
-import jsonpickle
 from . import process, misc
 
 try:
@@ -15,6 +15,11 @@ try:
 except ImportError:
     from pipes import quote as cmd_quote
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger('rclone')
 
 urllib3.disable_warnings()
@@ -123,7 +128,7 @@ class RcloneUploader:
             if self.service_account is not None:
 
                 rclone_data = subprocess.check_output(f'rclone config dump --config={cmd_quote(self.rclone_config_path)}', shell=True)
-                rclone_remotes = jsonpickle.decode(rclone_data)
+                rclone_remotes = orjson.loads(rclone_data) if orjson else json.loads(rclone_data)
                 config_remote = self.config['upload_remote'].split(":")[0]
 
                 def find_crypt_upstream(crypt_remote):
@@ -337,12 +342,14 @@ class RcloneSyncer:
 class RcloneThrottler:
     def __init__(self, url):
         self.url = url
+        # reuse one connection to the rc server across requests
+        self.session = requests.Session()
 
     def validate(self):
         success = False
         payload = {'validated': True}
         try:
-            resp = requests.post(urljoin(self.url, 'rc/noop'), json=payload, timeout=15, verify=False)
+            resp = self.session.post(urljoin(self.url, 'rc/noop'), json=payload, timeout=15, verify=False)
             if '{' in resp.text and '}' in resp.text:
                 data = resp.json()
                 success = data['validated']
@@ -353,9 +360,9 @@ class RcloneThrottler:
     def throttle_active(self, speed):
         if speed:
             try:
-                resp = requests.post(urljoin(self.url, 'core/stats'), timeout=15, verify=False)
+                resp = self.session.post(urljoin(self.url, 'core/stats'), timeout=15, verify=False)
                 if '{' in resp.text and '}' in resp.text:
-                    data = resp.json()
+                    data = orjson.loads(resp.content) if orjson else resp.json()
                     if 'transferring' in data and len(data['transferring']) > 0:
                         # Sum total speed of all active transfers to determine if greater than current_speed
                         current_speed = sum(
@@ -373,7 +380,7 @@ class RcloneThrottler:
         success = False
         payload = {'rate': speed}
         try:
-            resp = requests.post(urljoin(self.url, 'core/bwlimit'), json=payload, timeout=15, verify=False)
+            resp = self.session.post(urljoin(self.url, 'core/bwlimit'), json=payload, timeout=15, verify=False)
             if '{' in resp.text and '}' in resp.text:
                 data = resp.json()
                 if 'error' in data:
@@ -390,7 +397,7 @@ class RcloneThrottler:
         success = False
         payload = {'rate': 'off'}
         try:
-            resp = requests.post(urljoin(self.url, 'core/bwlimit'), json=payload, timeout=15, verify=False)
+            resp = self.session.post(urljoin(self.url, 'core/bwlimit'), json=payload, timeout=15, verify=False)
             if '{' in resp.text and '}' in resp.text:
                 data = resp.json()
                 if 'error' in data:
@@ -1,5 +1,6 @@
 import logging
 import glob
+import re
 import time
 
 from . import path
@@ -21,6 +22,10 @@ class Uploader:
         self.plex = plex
         self.dry_run = dry_run
         self.service_account = None
+        # match all opened_excludes in a single pass
+        opened_excludes = uploader_config.get('opened_excludes', [])
+        self.opened_excludes = re.compile('|'.join(re.escape(item) for item in opened_excludes),
+                                          re.IGNORECASE) if opened_excludes else None
 
     def set_service_account(self, sa_file):
         self.service_account = sa_file
@@ -34,9 +39,9 @@ class Uploader:
             files_to_exclude = self.__opened_files()
             if len(files_to_exclude):
                 log.info(f"Excluding these files from being uploaded because they were open: {files_to_exclude}")
-                # add files_to_exclude to rclone_config
-                for item in files_to_exclude:
-                    rclone_config['rclone_excludes'].append(glob.escape(item))
+                # add files_to_exclude to a new list, so they do not leak into the shared remote config
+                rclone_config['rclone_excludes'] = rclone_config['rclone_excludes'] + [glob.escape(item) for item in
+                                                                                       files_to_exclude]
 
         # do upload
         if self.service_account is not None:
@@ -83,18 +88,16 @@ class Uploader:
 
     # internals
     def __opened_files(self):
-        open_files = path.opened_files(self.rclone_config['upload_folder'])
+        upload_folder = self.rclone_config['upload_folder']
+        open_files = path.opened_files(upload_folder)
         return [
-            item.replace(self.rclone_config['upload_folder'], '')
+            item.replace(upload_folder, '')
             for item in open_files
             if not self.__is_opened_file_excluded(item)
         ]
 
     def __is_opened_file_excluded(self, file_path):
-        return any(
-            item.lower() in file_path.lower()
-            for item in self.uploader_config['opened_excludes']
-        )
+        return self.opened_excludes is not None and self.opened_excludes.search(file_path) is not None
 
     def __logic(self, data):
         # loop sleep triggers